@@ -1,8 +1,11 @@
 """Constants for the Score Sensor integration."""
 
+DOMAIN = "goal_sensor"
+
 # Config values
 SCORE_URL = "score_url"
 TEAM = "team"
+TEAMS = "teams"
 TIME_UNTIL_IDLE = "time_until_idle"
 IDLE_SCAN_INTERVAL = "idle_scan_interval"
 SCORE_RESET_TIME = "score_reset_time"
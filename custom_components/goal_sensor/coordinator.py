@@ -0,0 +1,207 @@
+"""Score coordinator shared by all Goal Sensors following the same score server."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import time
+import requests
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ScoreCoordinator(DataUpdateCoordinator):
+    """Polls one score server and fans the score out to all subscribed sensors.
+
+    The coordinator ticks every scan interval so the sensors can update their state, but
+    only requests the score every tick while any sensor is active, every idle_scan_interval
+    seconds otherwise and not at all while backing off. The data is the last fetched score.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        score_url: str,
+        score_request_timeout: float,
+        scan_interval: timedelta,
+        idle_scan_interval: int,
+        max_backoff: int,
+    ) -> None:
+        """init."""
+        super().__init__(
+            hass, _LOGGER, name=f"Goal Sensor {score_url}", update_interval=scan_interval
+        )
+        self._score_url = score_url
+        self._score_request_timeout = score_request_timeout
+        self._scan_interval = scan_interval
+        self._idle_scan_interval = idle_scan_interval
+        self._max_backoff = max_backoff
+
+        self._sensors = []
+
+        self._fetch_count = 0
+        self._last_update = datetime.min
+        self._back_off_time = datetime.min
+        self._back_off = 1
+        self._last_response = ""
+        self._score_etag = None
+        self._request_count = 0
+        self._poll_latency = None
+        self._received_at = None
+
+    @property
+    def request_settings(self) -> dict:
+        """Settings for requesting the score, shared by all sensors of this coordinator."""
+        return {
+            "score_request_timeout": self._score_request_timeout,
+            "idle_scan_interval": self._idle_scan_interval,
+            "max_backoff": self._max_backoff,
+        }
+
+    @property
+    def fetch_count(self) -> int:
+        """Number of successful fetches, used by sensors to tell if the score is new."""
+        return self._fetch_count
+
+    @property
+    def back_off(self) -> int:
+        """Current back off in seconds."""
+        return self._back_off
+
+    @property
+    def request_count(self) -> int:
+        """Number of requests made to the score server."""
+        return self._request_count
+
+    @property
+    def last_response(self) -> dict | str:
+        """The last json response from the score server."""
+        return self._last_response
+
+    @property
+    def poll_latency(self) -> dict | None:
+        """Latency breakdown of the last fetched score, up until the response was received."""
+        return self._poll_latency
+
+    @property
+    def received_at(self) -> float | None:
+        """Timestamp of when the last score response was received."""
+        return self._received_at
+
+    def add_sensor(self, sensor) -> None:
+        """Subscribe a sensor to the score from this server."""
+        self._sensors.append(sensor)
+
+    def is_backing_off(self, now: datetime) -> bool:
+        """Whether requests are paused after a failed fetch."""
+        return now < self._back_off_time
+
+    def reset_back_off(self) -> None:
+        """Clear the back off and fetch on the next update.
+
+        The back off is shared, so this resumes polling for every sensor of this coordinator.
+        """
+        self._back_off_time = datetime.min
+        self._back_off = 1
+        self._last_update = datetime.min
+
+    async def _async_update_data(self) -> dict | None:
+        """Fetch the score if it is time to poll, otherwise keep the last score."""
+        now = datetime.today()
+        if self.is_backing_off(now):
+            return self.data
+
+        if (now - self._last_update).total_seconds() < self._poll_interval():
+            return self.data
+
+        self._last_update = now
+        score = await self.hass.async_add_executor_job(self._request_score, now)
+        _LOGGER.debug("Fetched score: '%s'", score)
+        if score is None:
+            return self.data
+
+        self._back_off = 1
+        self._fetch_count += 1
+        return score
+
+    def _poll_interval(self) -> float:
+        # Poll every tick while any sensor is following a game, otherwise only every
+        # idle_scan_interval seconds (10 seconds by default). Half a scan interval is used
+        # as the limit so that timer jitter never skips a tick.
+        if any(sensor.is_active for sensor in self._sensors):
+            return self._scan_interval.total_seconds() / 2
+        return self._idle_scan_interval
+
+    def _increase_back_off(self, now: datetime) -> None:
+        self._back_off = min(self._back_off * 2, self._max_backoff)
+        self._back_off_time = now + timedelta(seconds=self._back_off)
+        self._last_update = datetime.min
+        _LOGGER.warning(
+            "Failed to fetch score from %s, backing off for %s seconds until %s",
+            self._score_url,
+            self._back_off,
+            self._back_off_time,
+        )
+
+    def _request_score(self, now: datetime) -> dict:
+        self._request_count += 1
+        headers = {}
+        if self._score_etag is not None:
+            headers["If-None-Match"] = self._score_etag
+
+        try:
+            response = requests.get(
+                self._score_url, timeout=self._score_request_timeout, headers=headers
+            )
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            self._increase_back_off(now)
+            return None
+
+        # Score hasn't changed since the last response
+        if response.status_code == 304:
+            return self._last_response["score"]
+
+        self._score_etag = None
+        try:
+            response_json = response.json()
+        except requests.exceptions.JSONDecodeError:
+            self._increase_back_off(now)
+            _LOGGER.warning("Did not get a json response: %s", response.content)
+            return None
+
+        self._last_response = response_json
+
+        if "score" not in response_json:
+            self._increase_back_off(now)
+            _LOGGER.error("Invalid json response %s", response_json)
+            return None
+
+        self._score_etag = response.headers.get("ETag")
+        self._received_at = time.time()
+        self._poll_latency = self._latency_breakdown(response_json, self._received_at)
+
+        return response_json["score"]
+
+    def _latency_breakdown(self, response_json: dict, received_at: float) -> dict | None:
+        """Split the time from frame capture until the score reached HA into stages.
+
+        Assumes the score server and HA clocks are in sync.
+        """
+        frame = response_json.get("frame")
+        served_at = response_json.get("served_at")
+        if not frame or served_at is None:
+            return None
+
+        captured_at = frame["captured_at"]
+        image_fetched_at = frame["image_fetched_at"]
+        ocr_done_at = frame["ocr_done_at"]
+        return {
+            "sequence": frame["sequence"],
+            "fetch_image": round(image_fetched_at - captured_at, 3),
+            "ocr": round(ocr_done_at - image_fetched_at, 3),
+            "ocr_to_served": round(served_at - ocr_done_at, 3),
+            "served_to_received": round(received_at - served_at, 3),
+            "capture_to_received": round(received_at - captured_at, 3),
+        }
@@ -2,18 +2,21 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+import hashlib
 import logging
-import requests
 import json
+import time
 import voluptuous as vol
 
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    DOMAIN,
     # States
     DISABLED,
     BACK_OFF,
@@ -23,24 +26,30 @@ from .const import (
     # Config Values
     SCORE_URL,
     TEAM,
+    TEAMS,
     TIME_UNTIL_IDLE,
     IDLE_SCAN_INTERVAL,
     SCORE_RESET_TIME,
     SCORE_REQUEST_TIMEOUT,
     MAX_BACKOFF,
 )
+from .coordinator import ScoreCoordinator
 
 SCAN_INTERVAL = timedelta(seconds=1)
-PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
-    {
-        vol.Required(SCORE_URL): cv.string,
-        vol.Required(TEAM): cv.string,
-        vol.Optional(TIME_UNTIL_IDLE): cv.positive_int,
-        vol.Optional(IDLE_SCAN_INTERVAL): cv.positive_int,
-        vol.Optional(SCORE_RESET_TIME): cv.positive_int,
-        vol.Optional(SCORE_REQUEST_TIMEOUT): cv.positive_float,
-        vol.Optional(MAX_BACKOFF): cv.positive_int,
-    }
+PLATFORM_SCHEMA = vol.All(
+    PLATFORM_SCHEMA.extend(
+        {
+            vol.Required(SCORE_URL): cv.string,
+            vol.Exclusive(TEAM, TEAM): cv.string,
+            vol.Exclusive(TEAMS, TEAM): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(TIME_UNTIL_IDLE): cv.positive_int,
+            vol.Optional(IDLE_SCAN_INTERVAL): cv.positive_int,
+            vol.Optional(SCORE_RESET_TIME): cv.positive_int,
+            vol.Optional(SCORE_REQUEST_TIMEOUT): cv.positive_float,
+            vol.Optional(MAX_BACKOFF): cv.positive_int,
+        }
+    ),
+    cv.has_at_least_one_key(TEAM, TEAMS),
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,19 +67,66 @@ async def async_setup_platform(
     platform.async_register_entity_service("enable", {}, "enable")
     platform.async_register_entity_service("disable", {}, "disable")
 
-    sensor = GoalSensor(
-        score_url=config[SCORE_URL],
-        score_request_timeout=config.get(SCORE_REQUEST_TIMEOUT, 0.5),
-        team=config[TEAM].lower(),
-        time_until_idle=config.get(TIME_UNTIL_IDLE, 15),
-        idle_scan_interval=config.get(IDLE_SCAN_INTERVAL, 10),
-        score_reset=config.get(SCORE_RESET_TIME, 1800),
-        max_backoff=config.get(MAX_BACKOFF, 128),
-    )
-    async_add_entities([sensor], True)
+    # Sensors following the same score server share one coordinator so the server is
+    # polled once per cycle regardless of the number of sensors. The first platform entry
+    # for a url decides the request settings.
+    score_url = config[SCORE_URL]
+    request_settings = {
+        SCORE_REQUEST_TIMEOUT: config.get(SCORE_REQUEST_TIMEOUT, 0.5),
+        IDLE_SCAN_INTERVAL: config.get(IDLE_SCAN_INTERVAL, 10),
+        MAX_BACKOFF: config.get(MAX_BACKOFF, 128),
+    }
+    coordinators = hass.data.setdefault(DOMAIN, {})
+    if score_url not in coordinators:
+        coordinator = ScoreCoordinator(
+            hass,
+            score_url=score_url,
+            score_request_timeout=request_settings[SCORE_REQUEST_TIMEOUT],
+            scan_interval=SCAN_INTERVAL,
+            idle_scan_interval=request_settings[IDLE_SCAN_INTERVAL],
+            max_backoff=request_settings[MAX_BACKOFF],
+        )
+        coordinators[score_url] = coordinator
+        await coordinator.async_refresh()
+    coordinator = coordinators[score_url]
+    if request_settings != coordinator.request_settings:
+        _LOGGER.warning(
+            "Goal sensors for %s are configured with different request settings, using %s from the first entry instead of %s",
+            score_url,
+            coordinator.request_settings,
+            request_settings,
+        )
+    url_hash = hashlib.sha1(score_url.encode()).hexdigest()[:8]
+
+    if TEAM in config:
+        # A single team keeps the original entity name and id
+        sensors = [
+            GoalSensor(
+                coordinator=coordinator,
+                team=config[TEAM].lower(),
+                time_until_idle=config.get(TIME_UNTIL_IDLE, 15),
+                score_reset=config.get(SCORE_RESET_TIME, 1800),
+            )
+        ]
+    else:
+        sensors = [
+            GoalSensor(
+                coordinator=coordinator,
+                team=team.lower(),
+                time_until_idle=config.get(TIME_UNTIL_IDLE, 15),
+                score_reset=config.get(SCORE_RESET_TIME, 1800),
+                name=f"Goal {team.upper()}",
+                unique_id=f"goal_sensor_{url_hash}_{team.lower()}",
+            )
+            for team in config[TEAMS]
+        ]
+
+    for sensor in sensors:
+        coordinator.add_sensor(sensor)
+    async_add_entities(sensors)
 
 
-class GoalSensor(SensorEntity):
+class GoalSensor(CoordinatorEntity[ScoreCoordinator], SensorEntity):
     """A Goal Sensor entity."""
 
     _attr_name = "Goal"
@@ -78,65 +134,83 @@ class GoalSensor(SensorEntity):
 
     def __init__(
         self,
-        score_url: str,
-        score_request_timeout: float,
+        coordinator: ScoreCoordinator,
         team: str,
         time_until_idle: int,
-        idle_scan_interval: int,
         score_reset: int,
-        max_backoff: int,
+        name: str = "Goal",
+        unique_id: str = "goal_sensor",
     ) -> None:
         """init."""
-        super().__init__()
+        super().__init__(coordinator)
 
         self._attr_has_entity_name = True
-        self._attr_name = "Goal"
+        self._attr_name = name
+        self._attr_unique_id = unique_id
         self._attr_native_value = IDLE
 
-        self._score_url = score_url
-        self._score_request_timeout = score_request_timeout
         self._team = team
         self._time_until_idle = time_until_idle
-        self._idle_scan_interval = idle_scan_interval
         self._score_reset = score_reset
-        self._max_backoff = max_backoff
 
         self._current_score = 0
         self._now = datetime.min
-        self._last_update = datetime.min
         self._last_score = datetime.min
-        self._back_off_time = datetime.min
-        self._back_off = 1
-        self._last_response = ""
-        self._request_count = 0
+        self._seen_fetch_count = 0
+        self._goal_latency = None
+        self._goal_detected = False
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the sensor is following a game and needs the score every cycle."""
+        return self._attr_native_value in (ACTIVE, GOAL)
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
         """Return the state attributes."""
         return {
-            "back_off": self._back_off,
+            "back_off": self.coordinator.back_off,
             "score": self._current_score,
-            "request_count": self._request_count,
-            "last_response": self._last_response
+            "request_count": self.coordinator.request_count,
+            "last_response": self.coordinator.last_response,
+            "poll_latency": self.coordinator.poll_latency,
+            "goal_latency": self._goal_latency,
         }
 
-    def enable(self) -> None:
-        """Enable sensor."""
+    async def enable(self) -> None:
+        """Enable sensor.
+
+        Also clears the back off of the coordinator, which resumes polling for all sensors
+        following the same score server.
+        """
         _LOGGER.info("Enabling sensor")
         self._attr_native_value = IDLE
         self._current_score = 0
-        self._last_update = datetime.min
         self._last_score = datetime.min
-        self._back_off_time = datetime.min
-        self._back_off = 1
+        self._seen_fetch_count = self.coordinator.fetch_count
+        self.coordinator.reset_back_off()
+        self.async_write_ha_state()
 
-    def disable(self) -> None:
+    async def disable(self) -> None:
         """Disable sensor."""
         _LOGGER.info("Disabling sensor")
         self._attr_native_value = DISABLED
-
-    def update(self) -> None:
-        """Update the Goal Sensor entity."""
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the Goal Sensor entity from the coordinator."""
+        self._update_state()
+        self.async_write_ha_state()
+
+        # The goal latency includes writing the GOAL state, so it is measured after the write
+        # and published as an attribute with the next update
+        if self._goal_detected:
+            self._goal_detected = False
+            self._goal_latency = self._goal_latency_breakdown(time.time())
+            _LOGGER.debug("Goal! Latency: %s", self._goal_latency)
+
+    def _update_state(self) -> None:
         state = self._attr_native_value
 
         if state == DISABLED:
@@ -146,6 +220,8 @@ class GoalSensor(SensorEntity):
 
         if state == BACK_OFF:
             self._update_backoff_state()
+        elif self.coordinator.is_backing_off(self._now):
+            self._attr_native_value = BACK_OFF
         elif state == IDLE:
             self._update_idle_state()
         elif state == ACTIVE:
@@ -154,15 +230,10 @@ class GoalSensor(SensorEntity):
             self._update_goal_state()
 
     def _update_backoff_state(self) -> None:
-        if self._now >= self._back_off_time:
+        if not self.coordinator.is_backing_off(self._now):
             self._attr_native_value = IDLE
-            self._last_update = datetime.min
 
     def _update_idle_state(self) -> None:
-        # Skip updating if were idle and not enough time has passed (10 seconds by default)
-        if self._time_since(self._last_update) <= self._idle_scan_interval:
-            return
-
         # Reset the current score after the game is over (default 30 minutes)
         if (
             self._current_score > 0
@@ -197,35 +268,23 @@ class GoalSensor(SensorEntity):
 
         # Scored a goal!
         if team_score > self._current_score:
-            _LOGGER.debug("Goal!")
             self._attr_native_value = GOAL
+            self._goal_detected = True
             self._current_score = team_score
 
     def _update_goal_state(self) -> None:
         _LOGGER.debug("Clearing goal state")
         self._attr_native_value = ACTIVE
 
-    def _increase_back_off(self) -> None:
-        self._attr_native_value = BACK_OFF
-        self._back_off = min(self._back_off * 2, self._max_backoff)
-        self._back_off_time = self._now + timedelta(seconds=self._back_off)
-        _LOGGER.warning(
-            "Failed to fetch score, backing off for %s seconds until %s",
-            self._back_off,
-            self._back_off_time,
-        )
-
     def _fetch_team_score(self) -> dict:
-        score = self._request_score()
-        _LOGGER.debug("Fetched score: '%s'", score)
-
-        if score is None:
+        # Only look at scores the coordinator fetched since the last time this sensor
+        # checked, the coordinator decides how often the score server is polled
+        fetch_count = self.coordinator.fetch_count
+        if fetch_count == self._seen_fetch_count:
             return None
+        self._seen_fetch_count = fetch_count
 
-        self._back_off = 1
-        self._last_update = self._now
-
-        team_score = score.get(self._team, None)
+        team_score = self.coordinator.data.get(self._team, None)
         if team_score is None:
             return None
 
@@ -233,31 +292,18 @@ class GoalSensor(SensorEntity):
 
         return team_score
 
-    def _request_score(self) -> dict:
-        self._request_count += 1
-        try:
-            response = requests.get(
-                self._score_url, timeout=self._score_request_timeout
-            )
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
-            self._increase_back_off()
-            return None
-
-        try:
-            response_json = response.json()
-        except requests.exceptions.JSONDecodeError:
-            self._increase_back_off()
-            _LOGGER.warning("Did not get a json response: %s", response.content)
+    def _goal_latency_breakdown(self, state_written_at: float) -> dict | None:
+        # Extends the latency of the poll with the time until the GOAL state was written
+        poll_latency = self.coordinator.poll_latency
+        if poll_latency is None:
             return None
 
-        self._last_response = response_json
-
-        if "score" not in response_json:
-            self._increase_back_off()
-            _LOGGER.error("Invalid json response %s", response_json)
-            return None
-
-        return response_json["score"]
+        received_to_goal = state_written_at - self.coordinator.received_at
+        return {
+            **poll_latency,
+            "received_to_goal": round(received_to_goal, 3),
+            "total": round(poll_latency["capture_to_received"] + received_to_goal, 3),
+        }
 
     def _time_since(self, time):
         return (self._now - time).seconds
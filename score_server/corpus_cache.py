@@ -0,0 +1,130 @@
+import cv2
+import numpy as np
+import argparse
+import fcntl
+import hashlib
+import json
+import logging
+import shutil
+import tempfile
+
+from pathlib import Path
+from utils import read_image, setup_logger
+
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent / ".corpus_cache"
+
+
+class Corpus:
+    """Labelled test images decoded to grayscale and stored in a memory-mapped cache.
+
+    The images in a corpus directory are laid out as <team1>_<team2>/<score1>_<score2>.jpg.
+    They are decoded once and stored back to back in a single array, frames are returned as
+    zero-copy views into the memory-mapped file. The cache is rebuilt when the images change.
+
+    Each build is written to a directory named after the fingerprint of the source images and
+    is never modified afterwards, so worker processes can safely load the cache while another
+    process rebuilds it. Builds are serialized with a lock file.
+    """
+
+    def __init__(self, image_dir: str | Path, reader: str, cache_dir: str | Path = CACHE_DIR) -> None:
+        """init."""
+        self.reader = reader
+        self._image_dir = Path(image_dir)
+
+        # Include a hash of the full path so that directories with the same name don't share a cache
+        path_hash = hashlib.sha1(str(self._image_dir.resolve()).encode()).hexdigest()[:8]
+        self._cache_root = Path(cache_dir) / f"{self._image_dir.name}-{path_hash}"
+
+        image_paths = sorted(path for path in self._image_dir.glob('*/*') if path.is_file())
+        self._cache_dir = self._cache_root / self._fingerprint(image_paths)
+
+        if not self._is_up_to_date():
+            self._build(image_paths)
+
+        with open(self._cache_dir / "index.json") as f:
+            self.entries = json.load(f)["entries"]
+        self._pixels = np.load(self._cache_dir / "pixels.npy", mmap_mode='r')
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def frame(self, index: int):
+        """Grayscale frame of the entry at index."""
+        entry = self.entries[index]
+        height, width = entry["shape"]
+        offset = entry["offset"]
+        return self._pixels[offset : offset + height * width].reshape(height, width)
+
+    def shard(self, worker: int, workers: int) -> list[int]:
+        """Indices of the entries handled by one of several worker processes."""
+        return list(range(worker, len(self.entries), workers))
+
+    def _fingerprint(self, image_paths) -> str:
+        digest = hashlib.sha1(f"{self.reader}\n".encode())
+        for path in image_paths:
+            stat = path.stat()
+            digest.update(f"{path.relative_to(self._image_dir)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+
+    def _is_up_to_date(self) -> bool:
+        return (self._cache_dir / "index.json").exists()
+
+    def _build(self, image_paths) -> None:
+        self._cache_root.mkdir(parents=True, exist_ok=True)
+        with open(self._cache_root.parent / f"{self._cache_root.name}.lock", 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            # Another process might have built the cache while we waited for the lock
+            if self._is_up_to_date():
+                return
+
+            _LOGGER.info("Building corpus cache for %s with %d images", self._image_dir, len(image_paths))
+            tmp_dir = Path(tempfile.mkdtemp(dir=self._cache_root))
+            self._write_cache(tmp_dir, image_paths)
+
+            # index.json is written last, so a directory without it is never loaded
+            tmp_dir.rename(self._cache_dir)
+
+            # Remove builds of older versions of the images
+            for old_dir in self._cache_root.iterdir():
+                if old_dir != self._cache_dir:
+                    shutil.rmtree(old_dir, ignore_errors=True)
+
+    def _write_cache(self, cache_dir, image_paths) -> None:
+        frames = []
+        entries = []
+        offset = 0
+        for path in image_paths:
+            frame = cv2.cvtColor(read_image(path), cv2.COLOR_BGR2GRAY)
+            entries.append({
+                "path": str(path),
+                "teams": path.parent.name.split('_'),
+                "score": [int(score) for score in path.stem.split('_')],
+                "shape": list(frame.shape),
+                "offset": offset,
+            })
+            frames.append(frame.ravel())
+            offset += frame.size
+
+        pixels = np.concatenate(frames) if len(frames) > 0 else np.zeros(0, np.uint8)
+        np.save(cache_dir / "pixels.npy", pixels)
+        with open(cache_dir / "index.json", 'w') as f:
+            json.dump({"reader": self.reader, "entries": entries}, f)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Build the decoded cache of a labelled test image directory')
+    parser.add_argument('image_dir', type=str, help='The directory with labelled test images')
+    parser.add_argument('--score_reader', type=str, help='Which score reader the images are for')
+    return parser.parse_args()
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    setup_logger()
+
+    corpus = Corpus(args.image_dir, args.score_reader)
+    print(f"Cached {len(corpus)} images")
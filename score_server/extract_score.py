@@ -6,10 +6,12 @@ from utils import read_image, setup_logger
 
 def parse_args():
     parser = argparse.ArgumentParser(description='Read score from an image')
-    parser.add_argument('image', type=str, help='The image to read from')
+    parser.add_argument('images', type=str, nargs='+', help='The images to read from')
     parser.add_argument('--score_reader', type=str, choices=SCORE_READERS.keys(), help='Which score reader to use')
     parser.add_argument('--save_images', action='store_true', help='If specified, the images are saved')
     parser.add_argument('--tesseract_path', type=str, default=None, help='Path to the tesseract executable')
+    parser.add_argument('--team_name_timeout', type=int, default=None, help='The time in seconds until the calculated team names should be refreshed')
+    parser.add_argument('--batch', action='store_true', help='If specified, the scores of all images are read in batches')
     return parser.parse_args()
 
 if __name__ == '__main__':
@@ -17,9 +19,14 @@ if __name__ == '__main__':
 
     setup_logger()
 
-    score_reader = SCORE_READERS[args.score_reader](args.save_images, args.tesseract_path)
+    score_reader = SCORE_READERS[args.score_reader](args.save_images, args.tesseract_path, args.team_name_timeout)
 
-    image = read_image(args.image)
+    images = [read_image(image) for image in args.images]
 
-    scores = score_reader.read_score(image)
-    print(f"Scores: {scores}")
\ No newline at end of file
+    if args.batch:
+        all_scores = score_reader.read_scores(images)
+    else:
+        all_scores = [score_reader.read_score(image) for image in images]
+
+    for image, scores in zip(args.images, all_scores):
+        print(f"Scores for {image}: {scores}")
\ No newline at end of file
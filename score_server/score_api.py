@@ -2,7 +2,11 @@ import base64
 import requests
 import argparse
 import logging
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import NamedTuple
 from score_reader import ScoreReader
 from signal_checker import SignalChecker
 from score_readers.score_readers import SCORE_READERS
@@ -12,6 +16,15 @@ from utils import setup_logger, image_from_buffer
 _LOGGER = logging.getLogger(__name__)
 
 
+class ScoreSnapshot(NamedTuple):
+    """A read score together with its version and timing, published as one value."""
+
+    score: dict
+    version: int
+    frame: dict
+    score_time: float | None
+
+
 class ScoreApi:
     """Score API."""
 
@@ -24,23 +37,100 @@ class ScoreApi:
 
         self._body = '{ "command":"cropped-image" }'
         self._previous_image = ""
-        self._previous_score: dict = {}
-
-    def fetch_score(self) -> dict:
-        """Fetch score."""
-
+        self._frame_sequence = 0
+        # The refresh thread replaces the snapshot with a single assignment so that requests
+        # never see a score paired with the version or frame of another read. The version is
+        # seeded with the start time so versions keep increasing across server restarts.
+        self._snapshot = ScoreSnapshot(score={}, version=int(time.time()), frame={}, score_time=None)
+
+        # Only one refresh (image fetch + OCR) is ever in flight. Requests that arrive
+        # while it is running wait on the same refresh instead of starting their own.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="score_refresh")
+        self._refresh_lock = threading.Lock()
+        self._pending_refresh = None
+
+    def fetch_score(self, deadline_seconds: float | None = None) -> dict:
+        """Fetch score.
+
+        Waits at most deadline_seconds for a fresh read. If the read does not finish in
+        time the last known score is returned with stale set and the refresh keeps running
+        in the background.
+        """
+
+        refresh = self._start_refresh()
+        try:
+            snapshot = refresh.result(timeout=deadline_seconds)
+            stale = False
+        except TimeoutError:
+            _LOGGER.debug("Refresh did not finish within %ss, returning last known score", deadline_seconds, extra={ "sampled": True })
+            snapshot = self._snapshot
+            stale = True
+
+        return {
+            "score": snapshot.score,
+            "version": snapshot.version,
+            "stale": stale,
+            "age": self._score_age(snapshot),
+            "frame": snapshot.frame,
+            "served_at": time.time(),
+        }
+
+    def _start_refresh(self):
+        with self._refresh_lock:
+            if self._pending_refresh is None or self._pending_refresh.done():
+                self._pending_refresh = self._executor.submit(self._refresh_score)
+                self._pending_refresh.add_done_callback(self._log_refresh_error)
+            return self._pending_refresh
+
+    def _log_refresh_error(self, refresh) -> None:
+        # Refreshes that finish after the deadline are never waited on, so errors would be lost
+        error = refresh.exception()
+        if error is not None:
+            _LOGGER.error("Failed to refresh score", exc_info=error)
+
+    def _refresh_score(self) -> ScoreSnapshot:
+        # The capture box grabs the frame when it is requested, so the time of the request
+        # is the capture time and the fetch is part of the measured latency
+        captured_at = time.time()
         image_text = self._request_image_data()
+        image_fetched_at = time.time()
 
+        previous = self._snapshot
         if image_text == self._previous_image:
-            _LOGGER.debug("Same image as before, returning cached score")
-            return self._previous_score
+            _LOGGER.debug("Same image as before, returning cached score", extra={ "sampled": True })
+            self._snapshot = previous._replace(score_time=time.time())
+            return self._snapshot
 
         img = self._get_image(image_text)
         score = self._score_reader.read_score(img)
+        ocr_done_at = time.time()
 
+        self._frame_sequence += 1
         self._previous_image = image_text
-        self._previous_score = score
-        return score
+        self._snapshot = ScoreSnapshot(
+            score=score,
+            version=previous.version + 1 if score != previous.score else previous.version,
+            # Timestamps of the first time this frame was seen, which is what goal latency is measured from
+            frame={
+                "sequence": self._frame_sequence,
+                "captured_at": captured_at,
+                "image_fetched_at": image_fetched_at,
+                "ocr_done_at": ocr_done_at,
+            },
+            score_time=ocr_done_at,
+        )
+        _LOGGER.debug("Read score from new frame", extra={ "sampled": True, "fields": {
+            "sequence": self._frame_sequence,
+            "fetch_image": round(image_fetched_at - captured_at, 4),
+            "ocr": round(ocr_done_at - image_fetched_at, 4),
+            "score": score,
+        } })
+        return self._snapshot
+
+    def _score_age(self, snapshot: ScoreSnapshot) -> float | None:
+        if snapshot.score_time is None:
+            return None
+        return round(time.time() - snapshot.score_time, 3)
 
     def has_signal(self) -> bool:
         """Check signal."""
@@ -66,7 +156,7 @@ class ScoreApi:
             _LOGGER.error("Connection timed out")
             return None
 
-        _LOGGER.debug("Response: %s", response)
+        _LOGGER.debug("Response: %s", response, extra={ "sampled": True })
 
         if "image" not in response:
             _LOGGER.error("Invalid json response, missing 'image' field")
@@ -93,7 +183,7 @@ if __name__ == '__main__':
     signal_checker = SignalChecker(args.no_signal_image)
     api = ScoreApi(args.url, 5, score_reader, signal_checker)
     
-    scores = api.fetch_score()
+    scores = api.fetch_score()["score"]
     print(f"Scores: {scores}")
 
     has_signal = api.has_signal()
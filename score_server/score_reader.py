@@ -28,6 +28,12 @@ class ScoreReader:
             Path("./images").mkdir(exist_ok=True)
             cv2.imwrite(f"./images/{name}.jpg", img)
 
+    def _to_grayscale(self, img):
+        # Frames from the test corpus cache are already grayscale
+        if img.ndim == 2:
+            return img
+        return cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
     def _read_team_names(self, img_left, img_right) -> str:
         now = time.time()
         time_since_last_refresh = now - self._last_name_calculation
@@ -47,10 +53,90 @@ class ScoreReader:
             if len(self._team2) == 0:
                 self._team2 = None
 
+    def _read_team_names_batch(self, imgs_left, imgs_right) -> list[tuple]:
+        """Read the team names of many frames, with one tesseract pass per side and batch.
+
+        Uses the cached team names for all frames while they are still within the team name
+        timeout. Names that the batched read missed or misread are read again on their own.
+        """
+        now = time.time()
+        if self._team1 is not None and now - self._last_name_calculation < self._team_name_time_out:
+            return [(self._team1, self._team2)] * len(imgs_left)
+
+        _LOGGER.debug("Recalculating team names for %d frames", len(imgs_left))
+        names_left = self._parse_team_name_batch(imgs_left)
+        names_right = self._parse_team_name_batch(imgs_right)
+
+        team_names = []
+        for img_left, img_right, team1, team2 in zip(imgs_left, imgs_right, names_left, names_right):
+            if not self._is_valid_team_name(team1):
+                team1 = self._parse_team_name(img_left)
+            if not self._is_valid_team_name(team2):
+                team2 = self._parse_team_name(img_right)
+            team_names.append((team1 or None, team2 or None))
+
+        if len(team_names) > 0:
+            self._team1, self._team2 = team_names[-1]
+            self._last_name_calculation = now
+        return team_names
+
     def _parse_team_name(self, img) -> str:
         pass
 
+    def _parse_team_name_batch(self, imgs) -> list[str]:
+        return [self._parse_team_name(img) for img in imgs]
+
+    def _is_valid_team_name(self, name) -> bool:
+        # Words from neighbouring rows can end up in the wrong row of a batched read, so
+        # readers with a known name format should check it
+        return len(name) > 0
+
     def _read_text(self, img, psm=None, allowed_chars=None, pattern=None):
+        config = self._tesseract_config(psm, allowed_chars, pattern)
+        text = pytesseract.image_to_string(img, lang='eng', config=config)
+        return text.strip().lower()
+
+    def _read_text_batch(self, imgs, allowed_chars=None, pattern=None, batch_size=50, row_gap=10) -> list[str]:
+        """Read the text of many same-kind crops with one tesseract pass per batch.
+
+        The crops are stacked on top of each other and read in multi-line mode, each recognized
+        word is mapped back to its crop from its vertical position. Crops where nothing was
+        recognized get an empty string.
+        """
+        texts = []
+        for i in range(0, len(imgs), batch_size):
+            texts += self._read_tiled_text(imgs[i : i + batch_size], allowed_chars, pattern, row_gap)
+        return texts
+
+    def _read_tiled_text(self, imgs, allowed_chars, pattern, row_gap) -> list[str]:
+        height = max(img.shape[0] for img in imgs)
+        width = max(img.shape[1] for img in imgs)
+
+        # Pad every crop to the same size with a gap above and below so that tesseract sees
+        # each crop as a separate line
+        rows = [
+            cv2.copyMakeBorder(img, row_gap, height - img.shape[0] + row_gap, 0, width - img.shape[1], cv2.BORDER_REPLICATE)
+            for img in imgs
+        ]
+        row_height = height + 2 * row_gap
+        tiled = cv2.vconcat(rows)
+        self._save_image(tiled, "tiled")
+
+        config = self._tesseract_config(6, allowed_chars, pattern)
+        data = pytesseract.image_to_data(tiled, lang='eng', config=config, output_type=pytesseract.Output.DICT)
+
+        words = [[] for _ in imgs]
+        for text, left, top, word_height in zip(data['text'], data['left'], data['top'], data['height']):
+            text = text.strip()
+            if len(text) == 0:
+                continue
+            row = (top + word_height // 2) // row_height
+            if row < len(words):
+                words[row].append((left, text))
+
+        return [''.join(text for _, text in sorted(row_words)).lower() for row_words in words]
+
+    def _tesseract_config(self, psm=None, allowed_chars=None, pattern=None) -> str:
         if psm == None:
             psm = 7
         config = f'--psm {psm}'
@@ -65,9 +151,12 @@ class ScoreReader:
         if allowed_chars != None:
             config += f' -c tessedit_char_whitelist={allowed_chars}'
 
-        text = pytesseract.image_to_string(img, lang='eng', config=config)
-        return text.strip().lower()
+        return config
 
     def read_score(self, img) -> dict:
         """Read score."""
         pass
+
+    def read_scores(self, imgs) -> list[dict]:
+        """Read the score of many images, e.g. when re-scoring an archived match."""
+        return [self.read_score(img) for img in imgs]
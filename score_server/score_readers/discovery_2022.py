@@ -1,5 +1,3 @@
-import cv2
-
 from score_reader import ScoreReader
 
 
@@ -12,8 +10,29 @@ class Discovery2022ScoreReader(ScoreReader):
         img_left, img_middle, img_right = self._split_image(img)
 
         self._read_team_names(img_left, img_right)
-        score_text = self._read_text(img_middle, allowed_chars='-0123456789')
+        score_text = self._read_score(img_middle)
+
+        return self._to_score(score_text)
+
+    def read_scores(self, imgs) -> list[dict]:
+        splits = [self._split_image(img) for img in imgs]
+        score_texts = self._read_text_batch([img_middle for (_, img_middle, _) in splits], allowed_chars='-0123456789')
+
+        team_names = self._read_team_names_batch([img_left for (img_left, _, _) in splits], [img_right for (_, _, img_right) in splits])
+
+        scores = []
+        for (_, img_middle, _), (team1, team2), score_text in zip(splits, team_names, score_texts):
+            self._team1, self._team2 = team1, team2
+            # Fall back to reading the crop on its own if the batched read failed
+            if not self._is_valid_score(score_text):
+                score_text = self._read_score(img_middle)
+            scores.append(self._to_score(score_text))
+        return scores
 
+    def _read_score(self, img):
+        return self._read_text(img, allowed_chars='-0123456789')
+
+    def _to_score(self, score_text) -> dict:
         if self._team1 is None or self._team2 is None or len(score_text) == 0:
             return {}
 
@@ -26,15 +45,25 @@ class Discovery2022ScoreReader(ScoreReader):
 
         return {self._team1: int(scores[0]), self._team2: int(scores[1])}
 
+    def _is_valid_score(self, score_text) -> bool:
+        scores = score_text.split('-')
+        return len(scores) == 2 and all(score.isdigit() for score in scores)
+
 
     def _parse_team_name(self, img) -> str:
         return self._read_text(img, allowed_chars='ABCDEFGHIJKLMNOPQRSTUVXYZ')
 
+    def _parse_team_name_batch(self, imgs) -> list[str]:
+        return self._read_text_batch(imgs, allowed_chars='ABCDEFGHIJKLMNOPQRSTUVXYZ')
+
+    def _is_valid_team_name(self, name) -> bool:
+        return name.isalpha()
+
     def _split_image(self, img):
         self._save_image(img, "initial")
 
         # Black and white
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        img = self._to_grayscale(img)
         self._save_image(img, "black_white")
 
         width = img.shape[1]
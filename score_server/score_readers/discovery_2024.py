@@ -1,5 +1,6 @@
 import cv2
 import numpy as np
+import re
 
 from pathlib import Path
 from utils import read_image
@@ -10,35 +11,131 @@ from score_reader import ScoreReader
 
 class Discovery2024ScoreReader(ScoreReader):
 
-    def __init__(self, save_images: bool, tesseract_path: str | None, team_name_time_out: int | None) -> None:
+    def __init__(
+        self,
+        save_images: bool,
+        tesseract_path: str | None,
+        team_name_time_out: int | None,
+        incremental: bool = False,
+        full_read_interval: int = 30,
+    ) -> None:
         super().__init__(save_images, tesseract_path, team_name_time_out)
         self.img_dash = self._read_dash_img()
-        
+
+        # In incremental mode only the side whose score crop changed is read again, with a
+        # full read of both sides every full_read_interval reads to guard against drift
+        self._incremental = incremental
+        self._full_read_interval = full_read_interval
+        self._reads_since_full_read = 0
+        # The crop of each side that its cached digit was read from
+        self._reference_crops = None
+        self._previous_digits = None
 
     def read_score(self, img) -> dict:
-        img_left, img_right, img_score = self._split_image(img)
+        img_left, img_right, img_left_score, img_right_score = self._split_image(img)
         self._read_team_names(img_left, img_right)
 
-        score = self._read_score(img_score)
-
-        if self._team1 is None or self._team2 is None or len(score) != 3 or '-' not in score:
+        if self._incremental:
+            score = self._read_score_incremental(img_left_score, img_right_score)
+        else:
+            score = self._read_score(self._score_image(img_left_score, img_right_score))
+
+        return self._to_score(score)
+
+    def read_scores(self, imgs) -> list[dict]:
+        splits = [self._split_image(img) for img in imgs]
+        score_imgs = [self._score_image(img_left_score, img_right_score) for (_, _, img_left_score, img_right_score) in splits]
+        score_texts = self._read_text_batch(score_imgs, allowed_chars="-0123456789", pattern=r'\d-\d')
+
+        team_names = self._read_team_names_batch([img_left for (img_left, _, _, _) in splits], [img_right for (_, img_right, _, _) in splits])
+
+        scores = []
+        for (team1, team2), img_score, score in zip(team_names, score_imgs, score_texts):
+            self._team1, self._team2 = team1, team2
+            # Fall back to reading the crop on its own if the batched read failed
+            if not self._is_valid_score(score):
+                score = self._read_score(img_score)
+            scores.append(self._to_score(score))
+        return scores
+
+    def _read_score_incremental(self, img_left_score, img_right_score) -> str:
+        crops = (img_left_score.copy(), img_right_score.copy())
+
+        if self._previous_digits is None or self._reads_since_full_read >= self._full_read_interval:
+            return self._read_full_score(crops)
+
+        # Compare against the crop the digit was read from rather than the previous frame, so
+        # that a digit fading in over several frames is still detected as a change
+        digits = list(self._previous_digits)
+        reference_crops = list(self._reference_crops)
+        for side, (crop, reference_crop) in enumerate(zip(crops, reference_crops)):
+            if self._is_same_crop(crop, reference_crop):
+                continue
+
+            digit = self._read_digit(crop)
+            if len(digit) != 1 or not digit.isdigit():
+                return self._read_full_score(crops)
+            digits[side] = digit
+            reference_crops[side] = crop
+
+        self._reads_since_full_read += 1
+        self._reference_crops = reference_crops
+        self._previous_digits = digits
+        return '-'.join(digits)
+
+    def _read_full_score(self, crops) -> str:
+        score = self._read_score(self._score_image(*crops))
+
+        if self._is_valid_score(score):
+            self._reference_crops = list(crops)
+            self._previous_digits = score.split('-')
+        else:
+            self._reference_crops = None
+            self._previous_digits = None
+        self._reads_since_full_read = 0
+
+        return score
+
+    def _is_same_crop(self, crop, previous_crop, max_distance=15.0) -> bool:
+        if crop.shape != previous_crop.shape:
+            return False
+
+        # Mean absolute pixel difference, the tolerance keeps compression noise and small
+        # changes in the background from counting as a change
+        distance = cv2.norm(crop, previous_crop, cv2.NORM_L1) / crop.size
+        return distance <= max_distance
+
+    def _to_score(self, score) -> dict:
+        if self._team1 is None or self._team2 is None or not self._is_valid_score(score):
             return {}
 
         scores = score.split("-")
 
         return {self._team1: int(scores[0]), self._team2: int(scores[1])}
 
+    def _is_valid_score(self, score) -> bool:
+        return re.fullmatch(r'\d-\d', score) is not None
+
     def _parse_team_name(self, img) -> str:
         return self._read_text(img, allowed_chars='ABCDEFGHIJKLMNOPQRSTUVXYZ', pattern=r'\A\A\A')
 
+    def _is_valid_team_name(self, name) -> bool:
+        return re.fullmatch(r'[a-z]{3}', name) is not None
+
+    def _parse_team_name_batch(self, imgs) -> list[str]:
+        return self._read_text_batch(imgs, allowed_chars='ABCDEFGHIJKLMNOPQRSTUVXYZ', pattern=r'\A\A\A')
+
     def _read_score(self, img):
         return self._read_text(img, allowed_chars="-0123456789", pattern=r'\d-\d')
 
+    def _read_digit(self, img):
+        return self._read_text(self._unsharp_mask(img, amount=2.0), allowed_chars="0123456789", pattern=r'\d')
+
     def _split_image(self, img):
         self._save_image(img, "initial")
 
         # Black and white
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        img = self._to_grayscale(img)
         self._save_image(img, "black_white")
 
         width = img.shape[1]
@@ -50,6 +147,14 @@ class Discovery2024ScoreReader(ScoreReader):
         img_right_score = img[:, int(0.62 * width) : int(0.72 * width)]
         img_right_name = img[:, int(0.82 * width) : width]
 
+        self._save_image(img_left_name, "left_name")
+        self._save_image(img_left_score, "left_score")
+        self._save_image(img_right_name, "right_name")
+        self._save_image(img_right_score, "right_score")
+
+        return img_left_name, img_right_name, img_left_score, img_right_score
+
+    def _score_image(self, img_left_score, img_right_score):
         # Build up a in image with the score seperated by a dash (e.g. 1-2), this seems to help tesseract
         # to read the numbers
         img_score = np.concatenate((img_left_score, self.img_dash, img_right_score), axis=1)
@@ -57,13 +162,9 @@ class Discovery2024ScoreReader(ScoreReader):
         # Unsharp mask seems to help with reading the score but makes reading the team names worse
         img_score = self._unsharp_mask(img_score, amount=2.0)
 
-        self._save_image(img_left_name, "left_name")
-        self._save_image(img_left_score, "left_score")
-        self._save_image(img_right_name, "right_name")
-        self._save_image(img_right_score, "right_score")
         self._save_image(img_score, "img_score")
 
-        return img_left_name, img_right_name, img_score
+        return img_score
 
     def _unsharp_mask(self, image, kernel_size=(5, 5), sigma=1.0, amount=1.0, threshold=1):
         blurred = cv2.GaussianBlur(image, kernel_size, sigma)
@@ -1,3 +1,5 @@
+from functools import partial
+
 from score_readers.discovery_2022 import Discovery2022ScoreReader
 from score_readers.discovery_2024 import Discovery2024ScoreReader
 
@@ -5,4 +7,5 @@ from score_readers.discovery_2024 import Discovery2024ScoreReader
 SCORE_READERS = {
     'discovery2022': Discovery2022ScoreReader,
     'discovery2024': Discovery2024ScoreReader,
+    'discovery2024_incremental': partial(Discovery2024ScoreReader, incremental=True),
 }
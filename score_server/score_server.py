@@ -6,7 +6,7 @@ import argparse
 from timeit import default_timer as timer
 
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from flask import Flask
+from flask import Flask, request
 
 from score_api import ScoreApi
 from score_reader import ScoreReader
@@ -17,30 +17,47 @@ from utils import setup_logger
 
 _LOGGER = logging.getLogger(__name__)
 
-def _log_and_return(start_time, response):
-	end_time = timer()
-	_LOGGER.info("Got request with response in %.2fs: %s", end_time - start_time, response)
+def _log_and_return(start_time, endpoint, response, level=logging.INFO, **fields):
+	duration = timer() - start_time
+	fields = { "endpoint": endpoint, "duration": round(duration, 4), **fields }
+	_LOGGER.log(level, "Got request in %.2fs", duration, extra={ "sampled": True, "fields": fields })
+	_LOGGER.debug("Response: %s", response, extra={ "sampled": True })
 	return response
 
 
-def run_server(port, score_api):
+def run_server(port, score_api, deadline):
 	app = Flask(__name__)
 	@app.route("/score", methods=['GET'])
 	def score():
 		start = timer()
-		result = score_api.fetch_score()
-		return _log_and_return(start, { "score": result })
+		result = score_api.fetch_score(deadline)
+		version = result["version"]
+		headers = { "ETag": f'"{version}"' }
+
+		since = request.args.get("since", type=int)
+		if since == version or request.if_none_match.contains(str(version)):
+			# Unchanged polls are the common case, only log them at debug level
+			return _log_and_return(start, "score", "", level=logging.DEBUG, status=304, version=version, stale=result["stale"]), 304, headers
+
+		return _log_and_return(start, "score", result, status=200, version=version, stale=result["stale"]), headers
 
 	@app.route("/hasSignal", methods=['GET'])
 	def has_signal():
 		start = timer()
 		result = score_api.has_signal()
-		return _log_and_return(start, { "hasSignal": result })
+		return _log_and_return(start, "hasSignal", { "hasSignal": result }, status=200)
 
 	waitress.serve(app, host="0.0.0.0", port=port)
 
 
 
+def positive_int(value):
+	number = int(value)
+	if number < 1:
+		raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+	return number
+
+
 def parse_args():
 	parser = argparse.ArgumentParser(description='Run the score server')
 	parser.add_argument('--url', type=str, help='The url where the image should be fetched')
@@ -50,12 +67,14 @@ def parse_args():
 	parser.add_argument('--no_signal_image', type=str, help='Path to a image that is shown when there is no signal')
 	parser.add_argument('--tesseract_path', type=str, default=None, help='Path to the tesseract executable')
 	parser.add_argument('--team_name_timeout', type=int, default=None, help='The time in seconds until the calculated team names should be refreshed')
+	parser.add_argument('--log_sample_rate', type=positive_int, default=1, help='Only log one in every N per-request log messages')
+	parser.add_argument('--deadline', type=float, default=0.4, help='The time in seconds to wait for a fresh score before returning the last known score')
 
 	return parser.parse_args()
 
 if __name__ == "__main__":
 	args = parse_args()
-	setup_logger(log_level=args.log_level, log_to_file=True)
+	setup_logger(log_level=args.log_level, log_to_file=True, sample_rate=args.log_sample_rate)
 
 	save_images = False
 	score_reader = SCORE_READERS[args.score_reader](save_images, args.tesseract_path, args.team_name_timeout)
@@ -64,4 +83,4 @@ if __name__ == "__main__":
 	timeout = 2
 	api = ScoreApi(args.url, timeout, score_reader, signal_checker)
 
-	run_server(args.port, api)
+	run_server(args.port, api, args.deadline)
@@ -0,0 +1,75 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+__unittest = True
+
+from pathlib import Path
+from utils import read_image
+
+import cv2
+import numpy as np
+
+from corpus_cache import Corpus
+
+
+class TestCorpusCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp_dir = Path(tempfile.mkdtemp())
+        self._cache_dir = self._tmp_dir / "cache"
+        self._image_dir = self._copy_images('test_images/discovery_2024/bkh_hif', self._tmp_dir / "a" / "corpus" / "bkh_hif")
+
+    def tearDown(self):
+        shutil.rmtree(self._tmp_dir)
+
+    def test_frames_match_images(self):
+        corpus = Corpus(self._image_dir.parent, 'discovery2024', self._cache_dir)
+
+        self.assertEqual(len(corpus), 4)
+        for i, entry in enumerate(corpus.entries):
+            self.assertEqual(entry["teams"], ["bkh", "hif"])
+            self.assertTrue(np.array_equal(corpus.frame(i), self._grayscale(entry["path"])))
+
+    def test_rebuilds_when_image_changes(self):
+        corpus = Corpus(self._image_dir.parent, 'discovery2024', self._cache_dir)
+        image_path = self._image_dir / "0_0.jpg"
+        index = [entry["path"] for entry in corpus.entries].index(str(image_path))
+
+        # Replace the image with another one and make sure the modification time changes
+        shutil.copy(self._image_dir / "2_1.jpg", image_path)
+        stat = image_path.stat()
+        os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        rebuilt = Corpus(self._image_dir.parent, 'discovery2024', self._cache_dir)
+
+        self.assertFalse(np.array_equal(rebuilt.frame(index), corpus.frame(index)))
+        self.assertTrue(np.array_equal(rebuilt.frame(index), self._grayscale(image_path)))
+
+    def test_rebuilds_when_image_is_added(self):
+        Corpus(self._image_dir.parent, 'discovery2024', self._cache_dir)
+        shutil.copy(self._image_dir / "2_1.jpg", self._image_dir / "3_1.jpg")
+
+        corpus = Corpus(self._image_dir.parent, 'discovery2024', self._cache_dir)
+
+        self.assertEqual(len(corpus), 5)
+
+    def test_directories_with_same_name_have_separate_caches(self):
+        other_dir = self._copy_images('test_images/discovery_2024/hbk_hif', self._tmp_dir / "b" / "corpus" / "hbk_hif")
+
+        corpus = Corpus(self._image_dir.parent, 'discovery2024', self._cache_dir)
+        other_corpus = Corpus(other_dir.parent, 'discovery2024', self._cache_dir)
+
+        self.assertEqual({tuple(entry["teams"]) for entry in corpus.entries}, {("bkh", "hif")})
+        self.assertEqual({tuple(entry["teams"]) for entry in other_corpus.entries}, {("hbk", "hif")})
+
+    def _copy_images(self, source, destination):
+        shutil.copytree(source, destination)
+        return destination
+
+    def _grayscale(self, path):
+        return cv2.cvtColor(read_image(path), cv2.COLOR_BGR2GRAY)
+
+if __name__ == '__main__':
+    unittest.main()
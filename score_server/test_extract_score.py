@@ -1,9 +1,10 @@
 import unittest
+import numpy as np
 
 __unittest = True
 
-from pathlib import Path
-from utils import read_image
+from unittest import mock
+from corpus_cache import Corpus
 
 from score_readers.discovery_2022 import Discovery2022ScoreReader
 from score_readers.discovery_2024 import Discovery2024ScoreReader
@@ -20,26 +21,79 @@ class TestScoreReader(unittest.TestCase):
     }
 
     def test_discovery2022(self):
-        self._test_images(Discovery2022ScoreReader, 'test_images/discovery_2022')
+        self._test_images(Discovery2022ScoreReader, 'test_images/discovery_2022', 'discovery2022')
 
     def test_discovery2024(self):
-        self._test_images(Discovery2024ScoreReader, 'test_images/discovery_2024')
+        self._test_images(Discovery2024ScoreReader, 'test_images/discovery_2024', 'discovery2024')
 
-    def _test_images(self, score_reader_type, path):
+    def test_discovery2024_incremental(self):
+        self._test_images(Discovery2024ScoreReader, 'test_images/discovery_2024', 'discovery2024', incremental=True)
+
+    def test_discovery2022_batched(self):
+        self._test_images_batched(Discovery2022ScoreReader, 'test_images/discovery_2022', 'discovery2022')
+
+    def test_discovery2024_batched(self):
+        self._test_images_batched(Discovery2024ScoreReader, 'test_images/discovery_2024', 'discovery2024')
+
+    def test_discovery2024_batched_rows(self):
+        """Checks how batched reads map words back to frames, with tesseract stubbed out."""
+        rows = {
+            'score': [[(30, '0'), (10, '1-')], [(10, '2-3')], [(10, '4-')]],
+            'left': [[(10, 'bkh')], [(10, 'bk')], [(10, 'bkh')]],
+            'right': [[(10, 'hif')], [(10, 'hif')], [(10, 'hif')]],
+        }
+        single_reads = { 'left': 'BKH\n', 'score': '4-4\n' }
+        self._score_reader = Discovery2024ScoreReader(save_images=False, tesseract_path=None, team_name_time_out=None)
+        imgs = [np.zeros((17, 112), np.uint8) for _ in range(3)]
+
+        # The reader reads the scores first, then the left and the right team names
+        calls = iter(['score', 'left', 'right'])
+        def image_to_data(tiled, **kwargs):
+            return self._tesseract_data(tiled, rows[next(calls)])
+
+        # Only the score reads allow a dash
+        def image_to_string(img, config, **kwargs):
+            return single_reads['score' if 'tessedit_char_whitelist=-' in config else 'left']
+
+        with mock.patch('pytesseract.image_to_data', side_effect=image_to_data) as data_mock, \
+                mock.patch('pytesseract.image_to_string', side_effect=image_to_string) as string_mock:
+            scores = self._score_reader.read_scores(imgs)
+
+        self.assertEqual(scores, [{'bkh': 1, 'hif': 0}, {'bkh': 2, 'hif': 3}, {'bkh': 4, 'hif': 4}])
+        # One tiled read each for the scores and both team names, the invalid team name
+        # and the invalid score are read again on their own
+        self.assertEqual(data_mock.call_count, 3)
+        self.assertEqual(string_mock.call_count, 2)
+
+    def _tesseract_data(self, tiled, rows):
+        """image_to_data output with the given (left, text) words placed in the middle of each row."""
+        row_height = tiled.shape[0] // len(rows)
+        data = { 'text': [], 'left': [], 'top': [], 'height': [] }
+        for row, words in enumerate(rows):
+            for left, text in words:
+                data['text'].append(text)
+                data['left'].append(left)
+                data['top'].append(row * row_height + row_height // 4)
+                data['height'].append(row_height // 2)
+        return data
+
+    def _test_images(self, score_reader_type, path, reader, **reader_args):
+        self._score_reader = score_reader_type(save_images=False, tesseract_path=None, team_name_time_out=None, **reader_args)
+        corpus = Corpus(path, reader)
+        for i, entry in enumerate(corpus.entries):
+            scores = self._score_reader.read_score(corpus.frame(i))
+            self._check_scores(entry, scores)
+
+    def _test_images_batched(self, score_reader_type, path, reader):
         self._score_reader = score_reader_type(save_images=False, tesseract_path=None, team_name_time_out=None)
-        for directory in Path(path).glob('*'):
-            teams = directory.name.split('_')
-
-            for image in directory.glob('*'):
-                score = [int(score) for score in image.stem.split('_')]
-                expected_score = { team: score for (team, score) in zip(teams, score) }
-                self._test_image(image, expected_score)
-      
-    def _test_image(self, image_path, expected_score):
-        image = read_image(image_path)
-        scores = self._score_reader.read_score(image)
-
-        with self.subTest(msg="Checking image", image=str(image_path)):
+        corpus = Corpus(path, reader)
+        all_scores = self._score_reader.read_scores([corpus.frame(i) for i in range(len(corpus))])
+        for entry, scores in zip(corpus.entries, all_scores):
+            self._check_scores(entry, scores)
+
+    def _check_scores(self, entry, scores):
+        expected_score = { team: score for (team, score) in zip(entry["teams"], entry["score"]) }
+        with self.subTest(msg="Checking image", image=entry["path"]):
             for team, score in expected_score.items():
                 self.assertTrue(self._has_score(team, score, scores), msg=f"Expected {expected_score}, got {scores}")
 
@@ -1,9 +1,15 @@
 import cv2
 import numpy as np
+import atexit
+import itertools
+import json
 import logging
 import logging.handlers
+import queue
 import time
 
+from collections import defaultdict
+
 from pathlib import Path
 
 
@@ -15,11 +21,44 @@ def read_image(file):
     with open(file, 'rb') as f:
         return image_from_buffer(f.read())
 
-def setup_logger(log_level='debug', log_to_file=False):
-    formatter = logging.Formatter('%(asctime)s,%(msecs)d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s')
+class StructuredFormatter(logging.Formatter):
+    """Formatter that appends the structured fields of a record as json.
+
+    Fields are passed with extra={"fields": {...}}.
+    """
+
+    def format(self, record):
+        message = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields is not None:
+            message += " " + json.dumps(fields, default=str)
+        return message
+
+
+class SampleFilter(logging.Filter):
+    """Lets through one in every sample_rate records that are marked with extra={"sampled": True}.
+
+    Each log statement is sampled separately.
+    """
+
+    def __init__(self, sample_rate: int) -> None:
+        """init."""
+        super().__init__()
+        self._sample_rate = sample_rate
+        self._counts = defaultdict(itertools.count)
+
+    def filter(self, record):
+        if not getattr(record, "sampled", False):
+            return True
+        return next(self._counts[(record.pathname, record.lineno)]) % self._sample_rate == 0
+
+
+def setup_logger(log_level='debug', log_to_file=False, sample_rate=1):
+    formatter = StructuredFormatter('%(asctime)s,%(msecs)d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s')
     formatter.converter = time.gmtime # UTC time
 
     logger = logging.getLogger()
+    handlers = []
 
     if log_to_file:
         script_dir = Path(__file__).resolve().parent
@@ -28,13 +67,24 @@ def setup_logger(log_level='debug', log_to_file=False):
         log_file = log_dir / "score_server.log"
         rotating_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=32_000_00, backupCount=3)
         rotating_handler.setFormatter(formatter)
-        logger.addHandler(rotating_handler)
+        handlers.append(rotating_handler)
 
     ch = logging.StreamHandler()
     ch.setFormatter(formatter)
-    logger.addHandler(ch)
+    handlers.append(ch)
+
+    # The handlers are run on a separate thread so that the threads serving requests
+    # never wait for disk or console I/O
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(SampleFilter(sample_rate))
+    logger.addHandler(queue_handler)
     logger.setLevel(get_log_level(log_level))
 
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
 def get_log_level(log_level):
     if log_level == 'debug':
         return logging.DEBUG